@@ -2,37 +2,25 @@
 
 import argparse
 import os
-import sqlite3
 import tqdm
 import sys
-import yaml
-import importlib.util
-
-from dotenv import load_dotenv
 
 from wordlist.lib.database import (
     add_or_update_source,
     add_word,
-    add_clue,
-    add_clue_to_word,
+    add_words_bulk,
+    add_clues_bulk,
+    bulk_write,
+    close_db,
     create_source_word,
     get_words,
+    open_db,
 )
+from wordlist.utils.config import load_fetch_clues, load_yaml
 from wordlist.utils.parsers import load_cc_txt_as_dict
 from wordlist.utils.printing import c_yellow, c_end, c_red, c_pink, c_green
 
-load_dotenv()
-
-os.environ["OPENAI_API_KEY"] = os.getenv("OPENAI_API_KEY")
-DATABASE_FILE = os.getenv("SQLITE_DB_FILE")
-CLUES_SOURCE = os.getenv("CLUES_SOURCE", "wordlist/lib/clues.py")
-
-
-module_name = os.path.splitext(os.path.basename(CLUES_SOURCE))[0]
-spec = importlib.util.spec_from_file_location(module_name, CLUES_SOURCE)
-module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(module)
-fetch_clues = module.fetch_clues
+fetch_clues = load_fetch_clues()
 
 if __name__ == "__main__":
 
@@ -66,8 +54,7 @@ if __name__ == "__main__":
 
     # 4. Load parameters from config.yml
     try:
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+        config = load_yaml(config_path)
 
         # Extract parameters from YAML
         name = config["name"]
@@ -86,7 +73,7 @@ if __name__ == "__main__":
         sys.exit(1)
 
     # Connect to the DB
-    conn = sqlite3.connect(DATABASE_FILE)
+    conn = open_db()
 
     # Add source
     source_id = add_or_update_source(
@@ -99,6 +86,7 @@ if __name__ == "__main__":
         print(f"{c_red}Error{c_end}: Could not add source to database.")
         conn.close()
         sys.exit(1)
+    print(f"Added or updated source with ID {source_id}.")
 
     # Get existing words from DB
     words_in_db = get_words(conn)
@@ -113,11 +101,13 @@ if __name__ == "__main__":
     # Sort by score (descending) in the parsed dict
     words_to_add.sort(key=lambda x: my_dict[x], reverse=True)
 
-    # Add missing words
-    for word in tqdm.tqdm(words_to_add):
-        word_upper = word.upper()
-        if not f_skip_clues:
-            clues = fetch_clues(word=word_upper)
+    # Add missing words (keys from load_cc_txt_as_dict are already uppercase)
+    if f_skip_clues:
+        tqdm.tqdm.write(f"{c_pink}Skipping{c_end} API calls for clues.")
+        add_words_bulk(conn, words_to_add)
+    else:
+        for word in tqdm.tqdm(words_to_add):
+            clues = fetch_clues(word=word)
             if clues:
                 tqdm.tqdm.write(
                     f"Clues {c_green}Found{c_end}. "
@@ -130,26 +120,19 @@ if __name__ == "__main__":
                     + f"Adding {c_yellow}{word}{c_end} to the database. "
                     + f"List score: {my_dict[word]}."
                 )
-        else:
-            clues = None
-            tqdm.tqdm.write(
-                f"{c_pink}Skipping{c_end} API call for without clues. "
-                + f"Adding {c_yellow}{word}{c_end} to the database. "
-                + f"List score: {my_dict[word]}."
-            )
-
-        add_word(conn, word)
-        if clues:
-            for c in clues:
-                add_clue(conn, c)
-                add_clue_to_word(conn, word, c)
+
+            # Committed per word so an interrupted crawl keeps what it has fetched
+            add_word(conn, word)
+            if clues:
+                add_clues_bulk(conn, word, clues)
 
     # Add all words to this source in DB
     tqdm.tqdm.write(
         f"Associating {c_yellow}{len(my_dict)}{c_end} words with source '{name}'."
     )
-    for w, score in tqdm.tqdm(my_dict.items()):
-        create_source_word(conn, source_id, w, score)
+    with bulk_write(conn):
+        for w, score in tqdm.tqdm(my_dict.items()):
+            create_source_word(conn, source_id, w, score)
 
-    conn.close()
+    close_db(conn)
     print(f"{c_green}Done!{c_end}")
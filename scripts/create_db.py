@@ -1,6 +1,7 @@
-import sqlite3
 import os
 
+from wordlist.lib.database import SCHEMA_VERSION, open_db
+from wordlist.utils.config import DATABASE_FILE
 from wordlist.utils.printing import c_yellow, c_end
 
 
@@ -47,13 +48,15 @@ def create_tables(cursor):
     )
 
     # Updated words table: clues information is now removed
+    # (clue_count mirrors the number of clue_usage rows for the word)
     cursor.execute(
         """
         CREATE TABLE IF NOT EXISTS words (
             word TEXT PRIMARY KEY NOT NULL,
             time_added TEXT NOT NULL,
             status TEXT NOT NULL CHECK(status IN ('approved', 'rejected', 'unchecked')),
-            status_last_updated TEXT NOT NULL
+            status_last_updated TEXT NOT NULL,
+            clue_count INTEGER NOT NULL DEFAULT 0
         );
     """
     )
@@ -96,15 +99,36 @@ def create_tables(cursor):
     """
     )
 
+    # Indexes for the status filters, clue lookups and per-model score lookups
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_words_status_word ON words(status, word)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_words_no_clues "
+        "ON words(word) WHERE clue_count = 0"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_clue_usage_word ON clue_usage(word, clue_id)"
+    )
+    cursor.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_wms_model_word
+        ON word_model_score(model, word, score);
+    """
+    )
+
+    # This is already the current schema, so open_db() has nothing to migrate
+    cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
 
 def main():
-    db_filename = "wordlist.db"
+    db_filename = DATABASE_FILE
     if os.path.exists(db_filename):
         print(f"{c_yellow}Warning{c_end}: The file '{db_filename}' already exists.")
         print("Please delete the existing database file before proceeding.")
         return
 
-    conn = sqlite3.connect(db_filename)
+    conn = open_db(db_filename)
     cursor = conn.cursor()
     create_tables(cursor)
     conn.commit()
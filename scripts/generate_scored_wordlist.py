@@ -9,20 +9,11 @@ Usage:
 
 import argparse
 import json
-import os
-import sqlite3
-
-from dotenv import load_dotenv
 
 import wordlist.lib.database
 from wordlist.utils.json import write_json
 from wordlist.utils.printing import c_red, c_green, c_yellow, c_end
 
-load_dotenv()
-
-os.environ["OPENAI_API_KEY"] = os.getenv("OPENAI_API_KEY")
-
-DATABASE_FILE = os.getenv("SQLITE_DB_FILE")
 SCORED_WORDLIST_TXT = "outputs/scored_wordlist.txt"
 SCORED_WORDLIST_JSON = "outputs/scored_wordlist.json"
 
@@ -55,7 +46,7 @@ def main():
     rescore_source = args.rescore_source
 
     # 2. Connect to DB & fetch scores for this model
-    conn = sqlite3.connect(DATABASE_FILE)
+    conn = wordlist.lib.database.open_db(readonly=True)
     cur = conn.cursor()
 
     if not rescore_source:
@@ -201,7 +192,7 @@ def main():
 
     print(f"{c_green}Done!{c_end} Generated scored wordlist for model {model_id}.")
 
-    conn = sqlite3.connect(DATABASE_FILE)
+    conn = wordlist.lib.database.open_db(readonly=True)
     approved_words = wordlist.lib.database.get_words(conn, status="approved")
     rejected_words = wordlist.lib.database.get_words(conn, status="rejected")
     write_json("outputs/all_words.json", sorted_word_list)
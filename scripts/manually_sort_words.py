@@ -4,11 +4,9 @@ Single-Panel Word Sorting Application with Enhanced UI/UX.
 Displays one word at a time with its clues and action buttons.
 """
 import os
-import sqlite3
 import sys
 import webbrowser
 
-from dotenv import load_dotenv
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (
@@ -24,19 +22,18 @@ from PyQt5.QtWidgets import (
 )
 
 from wordlist.lib.database import (
+    close_all,
+    close_db,
     get_clues_for_word,
     update_word_status,
     get_words,
     sort_words_by_score,
+    open_db,
 )
 
 from wordlist.utils.json import remove_from_json, load_json, write_json
 from wordlist.utils.printing import c_blue, c_end
 
-load_dotenv()
-
-os.environ["OPENAI_API_KEY"] = os.getenv("OPENAI_API_KEY")
-DB_PATH = os.getenv("SQLITE_DB_FILE")
 WORDLIST_SOURCE = "manually_sort_words.json"
 inputs_dir = "inputs"
 WORDLIST_SOURCE = os.path.join(inputs_dir, WORDLIST_SOURCE)
@@ -145,7 +142,7 @@ class WordCard(QWidget):
             self.google_button.setEnabled(False)
         else:
             self.word_label.setText("    " + word.upper() + f"  ({round(score, 3)})")
-            clues = get_clues_for_word(word, DB_PATH)
+            clues = get_clues_for_word(word)
             if not clues:
                 self.clues_text.setStyleSheet(
                     """
@@ -186,7 +183,7 @@ class WordCard(QWidget):
 class WordSortingApp(QWidget):
     def __init__(self):
         super().__init__()
-        self.conn = sqlite3.connect(DB_PATH)
+        self.conn = open_db()
 
         self.source = WORDLIST_SOURCE
         self.words_omitted = get_words(conn=self.conn, status="rejected")
@@ -200,15 +197,12 @@ class WordSortingApp(QWidget):
         if len(words_considered) > _max_words_considered:
             words_considered = words_considered[:_max_words_considered]
 
-        word_scores_dict = sort_words_by_score(self.conn, words_considered, 4)
+        word_scores_dict = sort_words_by_score(
+            self.conn, words_considered, 4, order="asc"
+        )
 
         self.scores_dict = word_scores_dict
-        order = "asc"
-        self.words_considered = sorted(
-            [w for w in word_scores_dict.keys()],
-            key=lambda w: word_scores_dict.get(w, 0),
-            reverse=order == "desc",
-        )
+        self.words_considered = list(word_scores_dict)
 
         self.total_words = len(self.words_considered)
         self.word_index = 0  # Pointer into words_considered
@@ -323,7 +317,7 @@ class WordSortingApp(QWidget):
         """
         if new_status in ["approved", "rejected"]:
             try:
-                update_word_status(self.conn, word, new_status)
+                update_word_status(self.conn, word, new_status, verbose=True)
                 remove_from_json(WORDLIST_SOURCE, word)
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Error processing '{word}': {e}")
@@ -345,7 +339,9 @@ class WordSortingApp(QWidget):
     def undo_rejection(self):
         entered_word = self.undo_input.toPlainText().strip().upper()
         try:
-            if update_word_status(self.conn, entered_word, "approved"):
+            if update_word_status(
+                self.conn, entered_word, "approved", verbose=True
+            ):
                 QMessageBox.information(
                     self, "Undo Successful", f"'{entered_word}' has been restored."
                 )
@@ -365,7 +361,8 @@ class WordSortingApp(QWidget):
 
     def closeEvent(self, event):
         if self.conn:
-            self.conn.close()
+            close_db(self.conn)
+        close_all()
         event.accept()
 
 
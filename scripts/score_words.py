@@ -6,29 +6,22 @@ Usage:
     python3 score_words.py --model [MODEL_ID]
 """
 import argparse
-import os
 import pickle
-import sqlite3
 import time
 import tqdm
 
-from dotenv import load_dotenv
-
 from wordlist.lib.svm import client, add_prefix, EMB_MODL
 from wordlist.lib.database import (
-    get_clues_for_word,
-    add_word_model_score,
+    get_clues_for_words,
+    add_word_model_scores,
+    close_all,
+    close_db,
     get_model_pkl_file_name,
+    open_db,
 )
 
 from wordlist.utils.printing import c_yellow, c_end
 
-load_dotenv()
-
-os.environ["OPENAI_API_KEY"] = os.getenv("OPENAI_API_KEY")
-
-DB_PATH = os.getenv("SQLITE_DB_FILE")
-
 
 def get_words_missing_scores(conn, model_id: int) -> list[str]:
     """
@@ -73,13 +66,14 @@ def main():
 
     model_id = args.model
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = open_db()
     PKL_FILE = get_model_pkl_file_name(conn, model_id)
 
     words = get_words_missing_scores(conn, model_id)
 
     chunk_size = 1500
-    words_considered = [add_prefix(w, get_clues_for_word(w)) for w in words]
+    clues = get_clues_for_words(words, conn=conn)
+    words_considered = [add_prefix(w, clues[w.upper()]) for w in words]
     word_scores = []
     with open(PKL_FILE, "rb") as file:
         clf = pickle.load(file)
@@ -97,14 +91,14 @@ def main():
             for j in range(i, min(i + chunk_size, len(words)))
         ]
 
-        for word, score in tqdm.tqdm(new_words):
-            tqdm.tqdm.write(f"{c_yellow}Adding{c_end} {word}: {score}")
-            add_word_model_score(conn, word, model_id, score)
+        add_word_model_scores(conn, model_id, new_words)
+        tqdm.tqdm.write(f"{c_yellow}Added{c_end} scores for {len(new_words)} words")
         word_scores += new_words
 
         time.sleep(0.1)  # Pause to avoid overloading
 
-    conn.close()
+    close_db(conn)
+    close_all()
 
 
 if __name__ == "__main__":
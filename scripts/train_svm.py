@@ -1,28 +1,36 @@
 """score the words in the wordlist using a pretrained SVM model"""
 
+import argparse
 import datetime
 import json
 import os
 import pickle
-import sqlite3
 
-from dotenv import load_dotenv
-
-from wordlist.lib.database import get_words_and_clues, add_model
+from wordlist.lib.database import get_words_and_clues, add_model, open_db
 from wordlist.lib.svm import train_svm
 from wordlist.utils.printing import c_red, c_end, c_yellow
 
 
-load_dotenv()
-
-os.environ["OPENAI_API_KEY"] = os.getenv("OPENAI_API_KEY")
-DATABASE_FILE = os.getenv("SQLITE_DB_FILE")
-
 if not os.path.exists("models"):
     os.makedirs("models")
 
 if __name__ == "__main__":
-    conn = sqlite3.connect(DATABASE_FILE)
+    parser = argparse.ArgumentParser(description="Train an SVM on the sorted words.")
+    parser.add_argument(
+        "--n_jobs",
+        type=int,
+        default=-1,
+        help="Number of parallel jobs for the grid search (-1 uses every core).",
+    )
+    parser.add_argument(
+        "--save",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Save (--save) or discard (--no-save) the trained model without prompting.",
+    )
+    args = parser.parse_args()
+
+    conn = open_db(readonly=True)
     try:
         approved = get_words_and_clues(conn=conn, status="approved")
         rejected = get_words_and_clues(conn=conn, status="rejected")
@@ -39,14 +47,17 @@ if __name__ == "__main__":
     if not approved or not rejected:
         print("Can't train svm unil sorted")
         exit()
-    best_clf, log_output = train_svm(approved, rejected)
+    best_clf, log_output = train_svm(approved, rejected, n_jobs=args.n_jobs)
 
-    out_in = input(c_yellow + "You you like to save model? (N to reject)" + c_end)
-    if out_in == "N":
+    if args.save is None:
+        out_in = input(c_yellow + "You you like to save model? (N to reject)" + c_end)
+        if out_in == "N":
+            exit()
+    elif not args.save:
         exit()
     # current daretime string format 2025-01-28 05:29:09
     date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    conn = sqlite3.connect(DATABASE_FILE)
+    conn = open_db()
     success = True
     try:
         score = log_output["test_score"]
@@ -6,22 +6,19 @@ Usage:
   python update_words.py
 """
 
-import os
-import sqlite3
 import tqdm
-import importlib.util
-
-from dotenv import load_dotenv
-
-from wordlist.lib.database import add_clue_to_word, add_clue, get_words_with_no_clues
+from concurrent.futures import ThreadPoolExecutor
+
+from wordlist.lib.database import (
+    add_clues_bulk,
+    bulk_write,
+    close_db,
+    get_words_with_no_clues,
+    open_db,
+)
+from wordlist.utils.config import CLUES_SOURCE, load_fetch_clues
 from wordlist.utils.printing import c_green, c_yellow, c_end
 
-load_dotenv()
-
-os.environ["OPENAI_API_KEY"] = os.getenv("OPENAI_API_KEY")
-DB_PATH = os.getenv("SQLITE_DB_FILE")
-CLUES_SOURCE = os.getenv("CLUES_SOURCE", "wordlist/lib/clues.template.py")
-
 if CLUES_SOURCE == "wordlist/lib/clues.template.py" or not CLUES_SOURCE:
     print(
         c_yellow
@@ -33,49 +30,60 @@ if CLUES_SOURCE == "wordlist/lib/clues.template.py" or not CLUES_SOURCE:
     exit()
 
 # Get the Fetch clues function from the clues source provided in your env
-module_name = os.path.splitext(os.path.basename(CLUES_SOURCE))[0]
-spec = importlib.util.spec_from_file_location(module_name, CLUES_SOURCE)
-module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(module)
-fetch_clues = module.fetch_clues
+fetch_clues = load_fetch_clues()
 
+_log_every = 1000
+_max_workers = 8  # set to 1 if your fetch_clues is not thread safe
+_chunk_size = 200
 
-def update_clues_for_word(conn: sqlite3.Connection, word: str) -> None:
+
+def fetch_clues_many(
+    words: list[str], max_workers: int = _max_workers
+) -> dict[str, list[str] | None]:
     """
-    Given a word, fetch its clues from an external API (fetch_clues)
-    and, if successful, update both the 'clues' and 'clues_last_updated'
-    fields in the 'words' table.
+    Calls fetch_clues for every word over a thread pool, since the lookups are
+    I/O bound and independent. Returns a dict mapping each word to its clues.
+    Database writes are left to the caller, on the main thread.
     """
-    clues = fetch_clues(word)
-    if clues:  # only update if clues is not empty
-        for c in clues:
-            add_clue(conn, c)
-            add_clue_to_word(conn, word, c)
-        return True
-    else:
-        return False
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(words, executor.map(fetch_clues, words)))
 
 
 def main():
     # 1. Connect to DB
-    conn = sqlite3.connect(DB_PATH)
+    conn = open_db()
 
     words_to_check = get_words_with_no_clues(conn)
-    # 3. Loop and update each missing word
+    # 3. Fetch clues for a chunk of words in parallel, then write them
+    #    Counts are shown on the progress bar (redrawn at tqdm's own rate) rather
+    #    than writing a line per word; a summary line is written every _log_every words.
     found_so_far = 0
-    for word in tqdm.tqdm(words_to_check, desc="Updating missing clues"):
-        if update_clues_for_word(conn, word):
-            tqdm.tqdm.write(
-                f"{c_green}Added{c_end} clues for word '{word}'. Found so far: {found_so_far}"
-            )
-            found_so_far += 1
-        else:
+    failed_so_far = 0
+    next_log = _log_every
+    pbar = tqdm.tqdm(total=len(words_to_check), desc="Updating missing clues")
+    for i in range(0, len(words_to_check), _chunk_size):
+        chunk = words_to_check[i : i + _chunk_size]
+        results = fetch_clues_many(chunk)
+        # Write the whole chunk in one transaction
+        with bulk_write(conn):
+            for word, clues in results.items():
+                if clues:  # only update if clues is not empty
+                    add_clues_bulk(conn, word, clues)
+                    found_so_far += 1
+                else:
+                    failed_so_far += 1
+        pbar.update(len(chunk))
+        pbar.set_postfix(found=found_so_far, failed=failed_so_far, refresh=False)
+        if found_so_far + failed_so_far >= next_log:
+            next_log += _log_every
             tqdm.tqdm.write(
-                f"{c_yellow}Failed{c_end} to update clues for word '{word}'. Found so far: {found_so_far}"
+                f"{c_green}Found{c_end} clues for {found_so_far} words, "
+                f"{c_yellow}failed{c_end} for {failed_so_far}."
             )
+    pbar.close()
 
     # 4. Cleanup
-    conn.close()
+    close_db(conn)
 
 
 if __name__ == "__main__":
@@ -6,6 +6,18 @@ def fetch_clues(word: str) -> list[str] | None:
     Given a word, return a str containing one or more clues for that word
 
     Example: fetch_clues("Cat") -> "- Mouse catcher\n- Word with house or hobie\n- Certain sailboat, for short"
+
+    If your clues come from a website, create one `requests.Session()` at module
+    level (with headers set once) and call `session.get(...)` here, rather than
+    `requests.get(...)`. This module is loaded once per run, so the session's
+    keep-alive connections are reused for every word instead of paying a new
+    TCP/TLS handshake per word. If you re-run over the same words, a
+    `requests_cache.CachedSession("clues_cache.sqlite", expire_after=...)` is a
+    drop-in replacement that serves repeat lookups from disk without touching the
+    site (skip any rate-limit sleep when `response.from_cache` is True).
+
+    scripts/update_clues.py calls this from several threads at once, so keep any
+    shared state thread safe (or set _max_workers = 1 in that script).
     """
 
     return None
@@ -1,40 +1,365 @@
+import atexit
+import functools
+import itertools
+import json
+import logging
 import os
 import sqlite3
-import time
+import threading
+
+from contextlib import contextmanager
+from urllib.request import pathname2url
 
-from dotenv import load_dotenv
 from tqdm import tqdm
 
+from wordlist.utils.config import DATABASE_FILE
 from wordlist.utils.printing import c_red, c_green, c_yellow, c_end
 
-load_dotenv()
 
-os.environ["OPENAI_API_KEY"] = os.getenv("OPENAI_API_KEY")
-DATABASE_FILE = os.getenv("SQLITE_DB_FILE")
+logger = logging.getLogger(__name__)
+
+_pool: dict[tuple[str, int], sqlite3.Connection] = {}
+_pool_lock = threading.Lock()
+_bulk_connections: set[int] = set()  # id() of connections inside bulk_write()
+
+_CLUE_SEP = "\x1f"  # char(31), used to join clues in get_words_and_clues()
+_BUSY_TIMEOUT = 30.0  # seconds to wait on another connection's write lock
+_STATEMENT_CACHE_SIZE = 1024  # prepared statements kept per connection
+_SCORE_CHUNK_SIZE = 10000  # rows per transaction in add_word_model_scores()
+SCHEMA_VERSION = 2  # PRAGMA user_version set by create_db.py and ensure_schema()
+
+# Timestamps are written by SQLite as CURRENT_TIMESTAMP (UTC, "YYYY-MM-DD HH:MM:SS")
+_SQL_INSERT_WORD = """
+    INSERT OR IGNORE INTO words (word, time_added, status, status_last_updated)
+    VALUES (?, CURRENT_TIMESTAMP, 'unchecked', CURRENT_TIMESTAMP)
+"""
+
+# Run once per word looked up by get_clues_for_word(); on the pooled connections
+# from get_conn() it is prepared once and then served from the statement cache.
+_SQL_GET_CLUES = """
+    SELECT c.clue
+    FROM clue_usage cu
+    JOIN clues c ON cu.clue_id = c.id
+    WHERE cu.word = ?
+"""
+
+# Statements run once per clue by add_clue() / add_clue_to_word(). add_clues_bulk()
+# runs the same UPSERT through executemany, without RETURNING, so both writers
+# apply the same last_seen rule.
+_SQL_UPSERT_CLUE_NO_ID = """
+    INSERT INTO clues (clue, last_seen) VALUES (?, CURRENT_TIMESTAMP)
+    ON CONFLICT(clue) DO UPDATE
+    SET last_seen = max(ifnull(clues.last_seen, ''), excluded.last_seen)
+"""
+_SQL_UPSERT_CLUE = _SQL_UPSERT_CLUE_NO_ID + "    RETURNING id\n"
+_SQL_INSERT_CLUE_USAGE = """
+    INSERT INTO clue_usage (word, clue_id, source)
+    SELECT ?1, ?2, ''
+    WHERE NOT EXISTS (SELECT 1 FROM clue_usage WHERE word = ?1 AND clue_id = ?2)
+"""
+_SQL_ADD_CLUE_COUNT = "UPDATE words SET clue_count = clue_count + ? WHERE word = ?"
+
+
+def open_db(
+    db_path: str = DATABASE_FILE,
+    check_same_thread: bool = True,
+    readonly: bool = False,
+) -> sqlite3.Connection:
+    """
+    Opens a connection to the wordlist database.
+    Scripts should connect through here so connection settings live in one place.
+
+    The connection is switched to WAL mode with synchronous=NORMAL, so readers
+    are not blocked by a writer and a commit no longer waits on a full fsync.
+    (journal_mode is stored in the database file; the rest are per connection.)
+    The prepared statement cache is raised from the default of 128 to
+    _STATEMENT_CACHE_SIZE so that mixed workloads through long-lived connections
+    do not keep re-preparing queries.
+
+    Writes are serialized by SQLite itself: a connection that finds the write lock
+    held waits up to _BUSY_TIMEOUT seconds for it instead of failing straight away
+    with "database is locked".
+
+    With readonly=True the file is opened with mode=ro, for code that only reads:
+    the database must already exist, any write raises sqlite3.OperationalError,
+    and the journal mode and indexes are left to the read-write connections.
+    """
+    if readonly:
+        conn = sqlite3.connect(
+            _readonly_uri(db_path),
+            uri=True,
+            timeout=_BUSY_TIMEOUT,
+            check_same_thread=check_same_thread,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
+    else:
+        conn = sqlite3.connect(
+            db_path,
+            timeout=_BUSY_TIMEOUT,
+            check_same_thread=check_same_thread,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+
+    if not readonly and _user_version(conn) < SCHEMA_VERSION:
+        has_tables = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'words'"
+        ).fetchone()
+        if has_tables:
+            ensure_schema(conn)
+    return conn
+
+
+def ensure_schema(conn: sqlite3.Connection) -> None:
+    """
+    Brings a database made by an older create_db.py up to date:
+    - adds words.clue_count (the number of clue_usage rows for the word) and
+      backfills it from clue_usage
+    - creates the indexes behind the status filters, clue lookups and per-model
+      score lookups, and runs ANALYZE so the query planner has statistics to use them
+
+    Records SCHEMA_VERSION in PRAGMA user_version when done; open_db() calls this
+    whenever the stored version is older, so it runs once per database. The whole
+    migration runs in one BEGIN IMMEDIATE transaction, so when two processes open
+    an old database at once, the second waits and then finds it already done.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if _user_version(conn) >= SCHEMA_VERSION:
+            conn.rollback()
+            return
+
+        # Created first: the clue_count backfill below looks clue_usage up by word
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_clue_usage_word "
+            "ON clue_usage(word, clue_id)"
+        )
+
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(words)")}
+        if "clue_count" not in columns:
+            conn.execute(
+                "ALTER TABLE words ADD COLUMN clue_count INTEGER NOT NULL DEFAULT 0"
+            )
+            conn.execute(
+                """
+                UPDATE words SET clue_count = (
+                    SELECT COUNT(*) FROM clue_usage cu WHERE cu.word = words.word
+                )
+                """
+            )
+
+        # Replaced by idx_words_status_word, which also covers get_words(status=...)
+        conn.execute("DROP INDEX IF EXISTS idx_words_status")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_words_status_word ON words(status, word)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_words_no_clues "
+            "ON words(word) WHERE clue_count = 0"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_wms_model_word "
+            "ON word_model_score(model, word, score)"
+        )
+        conn.execute("ANALYZE")
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
+
+def _readonly_uri(db_path: str) -> str:
+    return f"file:{pathname2url(os.path.abspath(db_path))}?mode=ro"
+
+
+def _user_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
 
 
-def get_clues_for_word(word: str, db_path: str = DATABASE_FILE) -> list:
+def get_conn(db_path: str = DATABASE_FILE) -> sqlite3.Connection:
     """
-    Returns a list of clue strings for the given word by querying the new clue_usage and clues tables.
-    If the word is not found or has no clues, returns an empty list.
+    Returns a long-lived read-only connection to db_path for the calling thread,
+    opening it on first use. Callers must not close it; use close_all() on shutdown.
+    """
+    key = (db_path, threading.get_ident())
+    conn = _pool.get(key)
+    if conn is None:
+        # check_same_thread=False only so close_all() can close it from any thread
+        conn = open_db(db_path, check_same_thread=False, readonly=True)
+        with _pool_lock:
+            _pool[key] = conn
+    return conn
+
+
+def close_db(conn: sqlite3.Connection) -> None:
+    """
+    Closes a connection from open_db(), first running PRAGMA optimize, which
+    refreshes the query planner statistics for tables whose contents have changed
+    enough (SQLite recommends it before closing). Read-only connections cannot
+    write the statistics, so for them this is a plain close.
     """
-    conn = sqlite3.connect(db_path)
     try:
-        cursor = conn.cursor()
-        # Convert input word to uppercase to match stored format.
-        cursor.execute(
-            """
-            SELECT c.clue
-            FROM clue_usage cu
-            JOIN clues c ON cu.clue_id = c.id
-            WHERE cu.word = ?
-            """,
-            (word.upper(),),
+        conn.execute("PRAGMA optimize")
+    except sqlite3.OperationalError:
+        pass
+    conn.close()
+
+
+def close_all() -> None:
+    """
+    Closes every connection handed out by get_conn().
+    Also registered with atexit, so pooled connections are closed on interpreter exit.
+    """
+    with _pool_lock:
+        for conn in _pool.values():
+            close_db(conn)
+        _pool.clear()
+
+
+atexit.register(close_all)
+
+
+def snapshot_for_scoring(db_path: str = DATABASE_FILE) -> sqlite3.Connection:
+    """
+    Returns a new in-memory database holding a copy of the words and
+    word_model_score tables (with their lookup indexes), for code that scans
+    scores over and over, e.g. repeated sort_words_by_score() or get_words() calls.
+
+    The copy does not see later writes to db_path; take a new snapshot after
+    writing scores (e.g. with add_word_model_scores()). Close it when done.
+    """
+    # uri=True so the read-only file: URI below is understood by ATTACH
+    mem = sqlite3.connect(
+        ":memory:", uri=True, cached_statements=_STATEMENT_CACHE_SIZE
+    )
+    mem.execute("ATTACH DATABASE ? AS disk", (_readonly_uri(db_path),))
+    mem.execute("CREATE TABLE words AS SELECT * FROM disk.words")
+    mem.execute(
+        "CREATE TABLE word_model_score AS SELECT * FROM disk.word_model_score"
+    )
+    mem.execute("DETACH DATABASE disk")
+    mem.execute("CREATE UNIQUE INDEX idx_words_word ON words(word)")
+    mem.execute("CREATE INDEX idx_words_status_word ON words(status, word)")
+    mem.execute(
+        "CREATE INDEX idx_wms_model_word ON word_model_score(model, word, score)"
+    )
+    mem.commit()
+    return mem
+
+
+@contextmanager
+def bulk_write(conn: sqlite3.Connection):
+    """
+    Runs a block of writes as a single transaction:
+
+        with bulk_write(conn):
+            for word in words:
+                add_word(conn, word)
+
+    The helpers in this module skip their own commit while inside the block, so the
+    whole batch is committed (and synced to disk) once on exit, or rolled back if
+    the block raises. Nested blocks join the outer transaction.
+
+    Outside a block each helper still commits its own write, so single calls keep
+    working unchanged; callers that write in a loop should wrap the loop in this.
+    Also available as transaction().
+
+    :raises sqlite3.ProgrammingError: If conn already has uncommitted writes when
+        the outermost block is entered. Commit or roll them back first; they are not
+        folded into the block, so a failing block could not undo them.
+    """
+    if id(conn) in _bulk_connections:
+        yield conn
+        return
+
+    if conn.in_transaction:
+        raise sqlite3.ProgrammingError(
+            "bulk_write() entered with uncommitted writes on the connection; "
+            "commit or roll them back first"
         )
-        rows = cursor.fetchall()
-        return [row[0] for row in rows] if rows else []
+    conn.execute("BEGIN IMMEDIATE")
+    _bulk_connections.add(id(conn))
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    else:
+        conn.commit()
     finally:
-        conn.close()
+        _bulk_connections.discard(id(conn))
+
+
+transaction = bulk_write
+
+
+def _commit(conn: sqlite3.Connection) -> None:
+    """Commits, unless conn is inside bulk_write(), which commits once at the end."""
+    if id(conn) not in _bulk_connections:
+        conn.commit()
+
+
+def get_clues_for_word(
+    word: str, db_path: str = DATABASE_FILE, conn: sqlite3.Connection = None
+) -> list:
+    """
+    Returns a list of clue strings for the given word by querying the new clue_usage and clues tables.
+    If the word is not found or has no clues, returns an empty list.
+
+    Without conn, the lookup goes through this thread's pooled connection to db_path
+    and results are cached per (word, db_path). Writes made through this module clear
+    the cache; call get_clues_for_word.cache_clear() after writing clues any other way.
+    Passing conn queries that connection directly, uncached, so it also sees the
+    caller's uncommitted writes.
+    """
+    # Convert input word to uppercase to match stored format.
+    if conn is not None:
+        return list(_query_clues(conn, word.upper()))
+    return list(_get_clues_cached(word.upper(), db_path))
+
+
+@functools.lru_cache(maxsize=100_000)
+def _get_clues_cached(word_upper: str, db_path: str) -> tuple[str, ...]:
+    return _query_clues(get_conn(db_path), word_upper)
+
+
+def _query_clues(conn: sqlite3.Connection, word_upper: str) -> tuple[str, ...]:
+    return tuple(row[0] for row in conn.execute(_SQL_GET_CLUES, (word_upper,)))
+
+
+get_clues_for_word.cache_clear = _get_clues_cached.cache_clear
+
+
+def get_clues_for_words(
+    words: list[str], db_path: str = DATABASE_FILE, conn: sqlite3.Connection = None
+) -> dict[str, list[str]]:
+    """
+    Batch version of get_clues_for_word(): looks up the clues for every word in
+    one query and returns a dict of uppercase word -> list of clue strings.
+    Words that are not found or have no clues map to an empty list.
+
+    Uses this thread's pooled connection to db_path when conn is not given.
+    """
+    if conn is None:
+        conn = get_conn(db_path)
+    # The words are bound as one JSON array, so the query text never changes and
+    # there is no limit on the number of words.
+    cur = conn.execute(
+        """
+        SELECT w.word, group_concat(c.clue, char(31))
+        FROM (SELECT DISTINCT value AS word FROM json_each(?)) w
+        LEFT JOIN clue_usage cu ON cu.word = w.word
+        LEFT JOIN clues c ON cu.clue_id = c.id
+        GROUP BY w.word
+        """,
+        (json.dumps([word.upper() for word in words]),),
+    )
+    return {word: clues.split(_CLUE_SEP) if clues else [] for word, clues in cur}
 
 
 def get_words_and_clues(conn, status: str = "") -> dict:
@@ -42,44 +367,31 @@ def get_words_and_clues(conn, status: str = "") -> dict:
     Fetches words and their associated clues from the database, filtered by status if provided.
     Returns a dictionary where each key is a word and the value is a list of clue strings.
     """
+    # SQLite groups the clues per word, joined with the ASCII unit separator
+    # (char(31)), so Python gets one row per word instead of one per clue.
+    # Words with no clues come back with NULL, which becomes an empty list.
+    query = """
+        SELECT w.word, group_concat(c.clue, char(31))
+        FROM words w
+        LEFT JOIN clue_usage cu ON w.word = cu.word
+        LEFT JOIN clues c ON cu.clue_id = c.id
+        {}
+        GROUP BY w.word
+        ORDER BY w.word;
+    """
     cur = conn.cursor()
     if status:
-        query = """
-            SELECT w.word, c.clue
-            FROM words w
-            LEFT JOIN clue_usage cu ON w.word = cu.word
-            LEFT JOIN clues c ON cu.clue_id = c.id
-            WHERE w.status = ?
-            ORDER BY w.word;
-        """
-        cur.execute(query, (status,))
+        cur.execute(query.format("WHERE w.status = ?"), (status,))
     else:
-        query = """
-            SELECT w.word, c.clue
-            FROM words w
-            LEFT JOIN clue_usage cu ON w.word = cu.word
-            LEFT JOIN clues c ON cu.clue_id = c.id
-            ORDER BY w.word;
-        """
-        cur.execute(query)
-
-    rows = cur.fetchall()
+        cur.execute(query.format(""))
 
-    # Build a dictionary mapping word to list of clues.
-    words_dict = {}
-    for word, clue in rows:
-        if word not in words_dict:
-            words_dict[word] = []
-        if clue is not None:
-            words_dict[word].append(clue)
+    return {word: clues.split(_CLUE_SEP) if clues else [] for word, clues in cur}
 
-    return words_dict
 
-
-def get_words(conn, status: str = ""):
+def iter_words(conn, status: str = ""):
     """
-    Fetches words from the database filtered by status.
-    If no status is provided, it fetches all words.
+    Yields words from the database one at a time, filtered by status.
+    If no status is provided, it yields all words.
     """
     cur = conn.cursor()
     if status:
@@ -89,63 +401,77 @@ def get_words(conn, status: str = ""):
         query = "SELECT word FROM words;"
         cur.execute(query)
 
-    rows = cur.fetchall()
-    return [answer for answer, in rows]
+    for (answer,) in cur:
+        yield answer
 
 
-def get_words_with_no_clues(conn) -> list:
+def get_words(conn, status: str = ""):
+    """
+    Fetches words from the database filtered by status.
+    If no status is provided, it fetches all words.
+    """
+    return list(iter_words(conn, status))
+
+
+def get_words_with_no_clues(
+    conn: sqlite3.Connection = None, db_path: str = DATABASE_FILE
+) -> list:
     """
     Returns a list of words from the words table that have no associated clues
     in the clue_usage table.
+
+    Uses this thread's pooled connection to db_path when conn is not given.
+    The connection is left open either way.
     """
-    try:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT w.word
-            FROM words w
-            LEFT JOIN clue_usage cu ON w.word = cu.word
-            WHERE cu.clue_id IS NULL
-            """
-        )
-        rows = cursor.fetchall()
-        return [row[0] for row in rows]
-    finally:
-        conn.close()
+    if conn is None:
+        conn = get_conn(db_path)
+    cursor = conn.cursor()
+    # words.clue_count is kept up to date by the clue writers in this module,
+    # and idx_words_no_clues holds exactly the rows this selects.
+    cursor.execute("SELECT word FROM words WHERE clue_count = 0")
+    return [row[0] for row in cursor]
 
 
 def sort_words_by_score(
-    conn: sqlite3.Connection, words: list[str], model_id: int
+    conn: sqlite3.Connection, words: list[str], model_id: int, order: str = "asc"
 ) -> dict[str, float]:
     """
     Sorts a list of words by their scores for a given model ID.
-    The scores are fetched from the 'word_model_score' table in the database.
+    The scores are fetched from the 'word_model_score' table in the database,
+    and the sorting is done by SQLite.
 
     :param conn: An active sqlite3.Connection object.
     :param words: A list of words to sort.
     :param model_id: The ID of the model to use for scoring.
     :param order: The order to sort the words in ('asc' or 'desc').
 
-    :return: A list of words sorted by their scores for the given model ID.
+    :return: A dict of word -> score, in sorted order. Words with no score
+        for the given model ID are left out.
     """
+    if order not in ("asc", "desc"):
+        raise ValueError(f"order must be 'asc' or 'desc', not '{order}'.")
+
     cur = conn.cursor()
 
     # Fetch the scores for the given model ID
+    # The words are bound as one JSON array rather than one "?" per word, so the
+    # query text never changes and there is no limit on the number of words.
+    # idx_wms_model_word on word_model_score(model, word, score), created by
+    # ensure_schema(), covers this query: each word is one index seek and the
+    # score is read from the index, never from the table.
     cur.execute(
         """
         SELECT word, score
         FROM word_model_score
         WHERE model = ?
-        AND word IN ({})
+        AND word IN (SELECT value FROM json_each(?))
+        ORDER BY score {}, word
         """.format(
-            ", ".join("?" for _ in words)
+            order.upper()
         ),
-        (model_id, *words),
+        (model_id, json.dumps(words)),
     )
-    scores = dict(cur.fetchall())
-
-    # Sort the words by their scores
-    return scores
+    return dict(cur.fetchall())
 
 
 def add_or_update_source(
@@ -156,57 +482,36 @@ def add_or_update_source(
     The sources table has UNIQUE constraints on name, source, and file.
     In practice, the 'source' field is used as the unique identifier.
 
-    Workflow:
-      1) Check if a row exists with the given source_link.
-      2) If it exists, update last_updated to CURRENT_TIMESTAMP and return its id.
-      3) If it does not exist, insert a new row with the current time for both
-         created_at and last_updated.
+    Workflow (a single UPSERT statement):
+      1) If a row exists with the given source_link, update last_updated to
+         CURRENT_TIMESTAMP.
+      2) Otherwise insert a new row with the current time for both created_at
+         and last_updated.
+      Either way the row's id is returned via RETURNING.
 
     :param conn: Active sqlite3.Connection object
     :param name: The descriptive name of the source (<= 50 chars, unique)
     :param source_link: The link or identifier for the source (<= 50 chars, unique)
     :param file_path: The local file path for this source (<= 50 chars, unique)
     :return: The row ID of the source in 'sources'
+
+    :raises sqlite3.IntegrityError: If name or file_path is already used by a
+        source with a different source_link.
     """
     cursor = conn.cursor()
-
-    # Step 1: Check if a row exists with the same source_link
     cursor.execute(
         """
-        SELECT id FROM sources
-        WHERE source = ?
+        INSERT INTO sources (name, source, file, created_at, last_updated)
+        VALUES (?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+        ON CONFLICT(source) DO UPDATE SET last_updated = CURRENT_TIMESTAMP
+        RETURNING id
         """,
-        (source_link,),
+        (name, source_link, file_path),
     )
-    row = cursor.fetchone()
-
-    if row:
-        # Step 2: Update the last_updated field for the existing row
-        source_id = row[0]
-        cursor.execute(
-            """
-            UPDATE sources
-            SET last_updated = CURRENT_TIMESTAMP
-            WHERE id = ?
-            """,
-            (source_id,),
-        )
-        conn.commit()
-        print(f"Updated last_updated for source ID {source_id}.")
-        return source_id
-    else:
-        # Step 3: Insert a new row with the current timestamps
-        cursor.execute(
-            """
-            INSERT INTO sources (name, source, file, created_at, last_updated)
-            VALUES (?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-            """,
-            (name, source_link, file_path),
-        )
-        new_id = cursor.lastrowid
-        conn.commit()
-        print(f"Inserted new source with ID {new_id}.")
-        return new_id
+    source_id = cursor.fetchone()[0]
+    _commit(conn)
+    logger.debug("Added or updated source with ID %s.", source_id)
+    return source_id
 
 
 def create_source_word(
@@ -227,8 +532,8 @@ def create_source_word(
             PRIMARY KEY (source_id, word_id)
         );
 
-    Behavior:
-      1. If (source_id, word_id, score) already exists exactly, prints a message and does nothing more.
+    Behavior (a single UPSERT statement, so it can also be run in bulk):
+      1. If (source_id, word_id, score) already exists exactly, nothing is written.
       2. If (source_id, word_id) exists but has a different score, updates the row's score.
       3. If no row with (source_id, word_id) exists, inserts a new row.
 
@@ -239,100 +544,54 @@ def create_source_word(
     :return: None
     """
     cursor = conn.cursor()
-
-    # 1) Check if there's already a row with the same (source_id, word_id)
-    cursor.execute(
-        """
-        SELECT score
-          FROM source_word
-         WHERE source_id = ?
-           AND word_id = ?
-    """,
-        (source_id, word_id),
-    )
-    row = cursor.fetchone()
-
-    if row is not None:
-        existing_score = row[0]
-        # If the row already has the exact same score, do nothing
-        if existing_score == score:
-            print(
-                f"[INFO] source_word entry (source_id={source_id}, word_id='{word_id}') "
-                "already exists with the same score. Nothing to do."
-            )
-        else:
-            # 2) (source_id, word_id) exists but different score -> update
-            cursor.execute(
-                """
-                UPDATE source_word
-                   SET score = ?
-                 WHERE source_id = ?
-                   AND word_id = ?
-            """,
-                (score, source_id, word_id),
-            )
-            print(
-                f"[INFO] Updated source_word (source_id={source_id}, word_id='{word_id}') "
-                f"from score={existing_score} to score={score}."
-            )
-        conn.commit()
-        return
-    else:
-        # 3) No row exists for (source_id, word_id) -> insert a new record
-        try:
-            cursor.execute(
-                """
-                INSERT INTO source_word (source_id, word_id, score)
-                VALUES (?, ?, ?)
+    try:
+        cursor.execute(
+            """
+            INSERT INTO source_word (source_id, word_id, score)
+            VALUES (?, ?, ?)
+            ON CONFLICT(source_id, word_id) DO UPDATE SET score = excluded.score
+            WHERE source_word.score IS NOT excluded.score
             """,
-                (source_id, word_id, score),
-            )
-            conn.commit()
-            print(
-                f"[INFO] Created new source_word (source_id={source_id}, word_id='{word_id}', score={score})."
-            )
-        except sqlite3.IntegrityError as e:
-            # Raise a more descriptive error if something unexpected happens (e.g., invalid FK reference).
-            raise ValueError(
-                f"Failed to insert into source_word: source_id={source_id}, word_id='{word_id}', score={score}. "
-                "Likely a foreign key or uniqueness constraint issue."
-            ) from e
-
-
-import sqlite3
-import time
-from wordlist.utils.printing import c_yellow, c_end
-from tqdm import tqdm  # if you use tqdm for logging
-
-DATABASE_FILE = "wordlist.db"
+            (source_id, word_id, score),
+        )
+        _commit(conn)
+    except sqlite3.IntegrityError as e:
+        # Raise a more descriptive error if something unexpected happens (e.g., invalid FK reference).
+        raise ValueError(
+            f"Failed to insert into source_word: source_id={source_id}, word_id='{word_id}', score={score}. "
+            "Likely a foreign key or uniqueness constraint issue."
+        ) from e
 
 
 def add_word(conn: sqlite3.Connection, word: str) -> None:
     """
     Adds a word into the words table if not already present.
-    The words table now only contains: word, time_added, status, status_last_updated.
+    The words table now only contains: word, time_added, status, status_last_updated,
+    clue_count.
     """
-    cursor = conn.cursor()
-
-    # Check if the word already exists (words stored in uppercase)
-    cursor.execute("SELECT rowid FROM words WHERE word = ?", (word.upper(),))
-    row = cursor.fetchone()
-    if row is not None:
+    # A one-word batch; an existing word is a no-op, which shows up as 0 inserted.
+    if add_words_bulk(conn, [word]) == 0:
         tqdm.write(
             f"{c_yellow}Warning:{c_end} Word {word} already exists in the database. Skipping."
         )
-        return
 
-    current_time = time.strftime("%Y-%m-%d %H:%M:%S")
-    # Insert into words table without clues columns.
-    cursor.execute(
-        """
-        INSERT INTO words (word, time_added, status, status_last_updated)
-        VALUES (?, ?, ?, ?)
-        """,
-        (word.upper(), current_time, "unchecked", current_time),
-    )
-    conn.commit()
+
+def add_words_bulk(conn: sqlite3.Connection, words: list[str]) -> int:
+    """
+    Adds many words in one transaction with status 'unchecked', equivalent to
+    calling add_word() once per word but without the per-word commit or warning.
+    Words already in the database are left untouched.
+
+    :param conn: Active sqlite3.Connection object
+    :param words: The words to add (case-insensitive; stored in uppercase)
+    :return: The number of words that were actually inserted
+    """
+    if not words:
+        return 0
+
+    with bulk_write(conn):
+        cursor = conn.executemany(_SQL_INSERT_WORD, [(word.upper(),) for word in words])
+    return cursor.rowcount
 
 
 def add_clue(conn: sqlite3.Connection, clue: str) -> int:
@@ -342,102 +601,102 @@ def add_clue(conn: sqlite3.Connection, clue: str) -> int:
     Returns the clue's id.
     """
     cursor = conn.cursor()
-    current_time = time.strftime("%Y-%m-%d %H:%M:%S")
-
-    # Check if the clue already exists
-    cursor.execute("SELECT id, last_seen FROM clues WHERE clue = ?", (clue,))
-    row = cursor.fetchone()
-    if row:
-        clue_id, existing_last_seen = row
-        # Update last_seen if the current time is more recent (using lexicographical order for ISO dates)
-        if current_time > existing_last_seen:
-            cursor.execute(
-                "UPDATE clues SET last_seen = ? WHERE id = ?", (current_time, clue_id)
-            )
-            conn.commit()
-        return clue_id
 
-    # Insert new clue
-    cursor.execute(
-        "INSERT INTO clues (clue, last_seen) VALUES (?, ?)", (clue, current_time)
-    )
-    conn.commit()
-    return cursor.lastrowid
+    # One UPSERT either inserts the clue or moves last_seen forward (ISO dates
+    # compare correctly as strings). The update has no WHERE clause on purpose:
+    # RETURNING skips rows a DO UPDATE ... WHERE leaves alone, and the id is needed.
+    cursor.execute(_SQL_UPSERT_CLUE, (clue,))
+    clue_id = cursor.fetchone()[0]
+    _commit(conn)
+    return clue_id
 
 
 def add_clue_to_word(conn: sqlite3.Connection, word: str, clue: str) -> None:
     """
     Adds an association between a word and a clue in the clue_usage table.
-    - If the clue does not exist, it is added via add_clue().
-    - If the association between the word and clue already exists,
-      updates the clue's last_seen date to the current date.
-    - Otherwise, creates a new association with a blank source.
+    - If the clue does not exist, it is added via add_clue(); if it does, add_clue()
+      moves its last_seen date forward.
+    - If the association does not exist yet, creates it with a blank source and
+      bumps the word's clue_count.
     """
     cursor = conn.cursor()
-    current_time = time.strftime("%Y-%m-%d %H:%M:%S")
     word_upper = word.upper()
 
-    # Ensure the clue exists and get its id.
-    clue_id = add_clue(conn, clue)
+    # One transaction for the clue and the association, instead of a commit each
+    with bulk_write(conn):
+        # Ensure the clue exists and get its id.
+        clue_id = add_clue(conn, clue)
 
-    # Check if an association already exists in clue_usage.
-    cursor.execute(
-        "SELECT id FROM clue_usage WHERE word = ? AND clue_id = ?",
-        (word_upper, clue_id),
-    )
-    row = cursor.fetchone()
-    if row:
-        # Association exists, so update the clue's last_seen date to the current time.
-        cursor.execute(
-            "UPDATE clues SET last_seen = ? WHERE id = ?", (current_time, clue_id)
-        )
-    else:
-        # Create a new association with an empty source.
+        # Insert the association only if it is missing; rowcount says whether it was.
+        cursor.execute(_SQL_INSERT_CLUE_USAGE, (word_upper, clue_id))
+        if cursor.rowcount:
+            cursor.execute(_SQL_ADD_CLUE_COUNT, (1, word_upper))
+    get_clues_for_word.cache_clear()
+
+
+def add_clues_bulk(conn: sqlite3.Connection, word: str, clues: list[str]) -> None:
+    """
+    Adds every clue for a word in one transaction, equivalent to calling
+    add_clue_to_word() once per clue.
+    - New clues are inserted, and existing clues have last_seen moved forward,
+      with a single UPSERT run through executemany.
+    - Associations missing from clue_usage are then added with one INSERT ... SELECT,
+      and the word's clue_count is raised by the number added.
+    """
+    if not clues:
+        return
+
+    cursor = conn.cursor()
+    word_upper = word.upper()
+
+    with bulk_write(conn):
+        cursor.executemany(_SQL_UPSERT_CLUE_NO_ID, [(clue,) for clue in clues])
         cursor.execute(
-            "INSERT INTO clue_usage (word, clue_id, source) VALUES (?, ?, ?)",
-            (word_upper, clue_id, ""),
+            """
+            INSERT INTO clue_usage (word, clue_id, source)
+            SELECT ?, c.id, ''
+            FROM clues c
+            WHERE c.clue IN (SELECT value FROM json_each(?))
+            AND NOT EXISTS (
+                SELECT 1 FROM clue_usage cu WHERE cu.word = ? AND cu.clue_id = c.id
+            )
+            """,
+            (word_upper, json.dumps(clues), word_upper),
         )
-    conn.commit()
+        if cursor.rowcount:
+            cursor.execute(_SQL_ADD_CLUE_COUNT, (cursor.rowcount, word_upper))
+    get_clues_for_word.cache_clear()
 
 
 def add_model(
     conn, time_trained: str, training_score: float, training_duration: int, meta: str
-) -> int:
+) -> str:
     """
-    Inserts a new model row into the 'model' table, then updates its pkl_file_name
-    to match the newly assigned model ID.
+    Inserts a new model row into the 'model' table, with a pkl_file_name that
+    matches the newly assigned model ID, in a single statement.
 
     :param conn: An active sqlite3.Connection object.
     :param datetime_trained: A string representing the training time (ISO 8601 recommended).
     :param training_score: The model's training performance score as a float.
 
-    :return: The newly assigned 'id' from the 'model' table.
+    :return: The pkl_file_name of the new model, e.g. "models/123.pkl".
     """
     cur = conn.cursor()
 
-    # 1. Insert a placeholder row (autoincrement assigns an ID)
+    # The ID is picked as MAX(id) + 1 (the same ID SQLite would assign to this
+    # INTEGER PRIMARY KEY), so pkl_file_name can be written in the same INSERT.
     cur.execute(
         """
-        INSERT INTO model (pkl_file_name, training_score, datetime_trained, training_duration, meta)
-        VALUES ('placeholder', ?, ?, ?, ?)
+        INSERT INTO model (id, pkl_file_name, training_score, datetime_trained, training_duration, meta)
+        SELECT new_id, 'models/' || new_id || '.pkl', ?, ?, ?, ?
+        FROM (SELECT COALESCE(MAX(id), 0) + 1 AS new_id FROM model)
+        RETURNING pkl_file_name
         """,
         (training_score, time_trained, training_duration, meta),
     )
-    new_id = cur.lastrowid  # the newly assigned primary key
+    pkl_file_name = cur.fetchone()[0]
 
-    # 2. Update the just-inserted row so pkl_file_name matches new_id
-    #    For example, you can store it as "123.pkl" or just "123"
-    pkl_file_name = f"models/{new_id}.pkl"
-    cur.execute(
-        """
-        UPDATE model
-        SET pkl_file_name = ?
-        WHERE id = ?
-        """,
-        (pkl_file_name, new_id),
-    )
-
-    conn.commit()
+    _commit(conn)
     return pkl_file_name
 
 
@@ -464,19 +723,53 @@ def add_word_model_score(
             """,
             (word.upper(), model_id, score),
         )
-        conn.commit()
+        _commit(conn)
     except sqlite3.IntegrityError as e:
         # Handle or re-raise integrity errors (duplicate primary key, foreign key missing, etc.)
         raise e
 
 
-def update_word_status(conn: sqlite3.Connection, word: str, new_status: str) -> None:
+def add_word_model_scores(
+    conn: sqlite3.Connection,
+    model_id: int,
+    word_score_pairs,
+    chunk_size: int = _SCORE_CHUNK_SIZE,
+) -> None:
+    """
+    Writes many (word, score) pairs for one model, chunk_size rows per transaction.
+    Unlike add_word_model_score(), an existing (word, model) row has its score
+    replaced rather than raising sqlite3.IntegrityError.
+
+    :param conn: A live sqlite3.Connection object.
+    :param model_id: The integer ID of the model (foreign key to model.id).
+    :param word_score_pairs: An iterable of (word, score) tuples.
+    :param chunk_size: Rows per transaction, which keeps each commit's WAL growth bounded.
+    """
+    rows = ((word.upper(), model_id, score) for word, score in word_score_pairs)
+    while chunk := list(itertools.islice(rows, chunk_size)):
+        with bulk_write(conn):
+            conn.executemany(
+                """
+                INSERT INTO word_model_score (word, model, score)
+                VALUES (?, ?, ?)
+                ON CONFLICT(word, model) DO UPDATE SET score = excluded.score
+                """,
+                chunk,
+            )
+
+
+def update_word_status(
+    conn: sqlite3.Connection, word: str, new_status: str, verbose: bool = False
+) -> bool:
     """
     Updates the status of a given word in the 'words' table.
 
     :param conn: An active sqlite3.Connection object.
     :param word: The word whose status needs to be updated.
     :param new_status: The new status to set for the word (e.g., 'approved', 'rejected', 'unchecked').
+    :param verbose: Write a Success/Notice line for the outcome (errors are always written).
+
+    :return: True if the status was changed, False if the word already had new_status.
 
     :raises ValueError: If the word does not exist in the database.
     :raises sqlite3.Error: If a database error occurs during the operation.
@@ -485,44 +778,44 @@ def update_word_status(conn: sqlite3.Connection, word: str, new_status: str) ->
     cur = conn.cursor()
 
     try:
-        # Check if the word exists
-        cur.execute("SELECT status FROM words WHERE word = ?", (word_upper,))
-        row = cur.fetchone()
+        # Update the status only if it's different; rowcount says whether it was
+        cur.execute(
+            """
+            UPDATE words
+            SET status = ?,
+                status_last_updated = CURRENT_TIMESTAMP
+            WHERE word = ? AND status != ?
+            """,
+            (new_status, word_upper, new_status),
+        )
+        changed = cur.rowcount
+        # Commit even when no row matched: the UPDATE has already opened a
+        # transaction, which would otherwise keep holding the write lock
+        _commit(conn)
+        if changed:
+            if verbose and new_status == "approved":
+                tqdm.write(
+                    f"{c_green}Success:{c_end} Updated status of '{word_upper}' to {c_green}'{new_status}'{c_end}."
+                )
+            elif verbose:
+                tqdm.write(
+                    f"{c_yellow}Notice:{c_end} Updated status of '{word_upper}' to {c_yellow}'{new_status}'{c_end}."
+                )
+            return True
 
-        if row is None:
+        # Nothing changed: either the word is missing or already has new_status
+        cur.execute("SELECT 1 FROM words WHERE word = ?", (word_upper,))
+        if cur.fetchone() is None:
             tqdm.write(
                 f"{c_red}Error:{c_end} Word '{word_upper}' does not exist in the database."
             )
             raise ValueError(f"Word '{word_upper}' not found in the database.")
 
-        current_status = row[0]
-
-        # Update the status only if it's different
-        if current_status != new_status:
-            cur.execute(
-                """
-                UPDATE words 
-                SET status = ?,
-                    status_last_updated = datetime('now')
-                WHERE word = ?
-                """,
-                (new_status, word_upper),
-            )
-            conn.commit()
-            if new_status == "approved":
-                tqdm.write(
-                    f"{c_green}Success:{c_end} Updated status of '{word_upper}' from '{current_status}' to {c_green}'{new_status}'{c_end}."
-                )
-            else:
-                tqdm.write(
-                    f"{c_yellow}Notice:{c_end} Updated status of '{word_upper}' from '{current_status}' to {c_yellow}'{new_status}'{c_end}."
-                )
-            return True
-        else:
+        if verbose:
             tqdm.write(
                 f"{c_yellow}Notice:{c_end} The word '{word_upper}' already has status '{new_status}'. No update needed."
             )
-            return False
+        return False
 
     except sqlite3.Error as e:
         tqdm.write(f"{c_red}SQLite Error:{c_end} {e}")
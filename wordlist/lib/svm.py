@@ -1,53 +1,68 @@
+import itertools
 import json
-import os
 import pickle
 import time
 import tqdm
-import yaml
 
-from dotenv import load_dotenv
+import numpy as np
+
+from concurrent.futures import ThreadPoolExecutor
 from openai import OpenAI
 from typing import List, Tuple
 
-from sklearn.svm import SVC
+from sklearn.svm import SVC, LinearSVC
 from sklearn.decomposition import PCA
 from sklearn.model_selection import train_test_split, GridSearchCV
 from sklearn.metrics import accuracy_score
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
 
-from wordlist.lib.database import get_clues_for_word
+from wordlist.lib.database import get_clues_for_words
+from wordlist.utils.config import EMB_MODL, load_search_config
 from wordlist.utils.printing import c_blue, c_end
 
 # ------------------------------------------------------------------------------
 #  Initialization / Config
 # ------------------------------------------------------------------------------
-load_dotenv(dotenv_path=".env")
-
-os.environ["OPENAI_API_KEY"] = os.getenv("OPENAI_API_KEY")
-EMB_MODL = os.getenv("EMB_MODL")
 
 # Create OpenAI client (adjust as needed)
 client = OpenAI()
 
-with open("search_config.yml", "r") as file:
-    config = yaml.safe_load(file)
+config = load_search_config()
 
 tt_split = config["ratio_test"]  # 0.2 means 20% test set
 tolerance = config["tolerance"]
 max_iter = config["max_iter"]
 
-SEARCH_PARAM = {
-    "svm__kernel": config["svm_parameters"]["kernel"],
-    "svm__degree": config["svm_parameters"][
-        "degree"
-    ],  # Including degree 5 for more nonlinearity
-    "svm__gamma": config["svm_parameters"]["gamma"],
-    "svm__coef0": config["svm_parameters"]["coef0"],  # Independent term
-    "svm__C": config["svm_parameters"][
-        "C"
-    ],  # Regularization parameter; higher C allows more overfitting
-}
+_kernels = config["svm_parameters"]["kernel"]
+_svc_kernels = [k for k in _kernels if k != "linear"]
+
+SEARCH_PARAM = []
+if _svc_kernels:
+    SEARCH_PARAM.append(
+        {
+            "svm__kernel": _svc_kernels,
+            "svm__degree": config["svm_parameters"][
+                "degree"
+            ],  # Including degree 5 for more nonlinearity
+            "svm__gamma": config["svm_parameters"]["gamma"],
+            "svm__coef0": config["svm_parameters"]["coef0"],  # Independent term
+            "svm__C": config["svm_parameters"][
+                "C"
+            ],  # Regularization parameter; higher C allows more overfitting
+        }
+    )
+if "linear" in _kernels:
+    # A linear kernel is trained with liblinear's LinearSVC, which scales with
+    # N * D instead of SVC's N^2 or worse; degree/gamma/coef0 do not apply to it.
+    # dual=False solves the primal, the fast side when there are far more words
+    # than embedding dimensions (what dual="auto" picks on scikit-learn >= 1.3).
+    SEARCH_PARAM.append(
+        {
+            "svm": [LinearSVC(dual=False, tol=tolerance, max_iter=max_iter)],
+            "svm__C": config["svm_parameters"]["C"],
+        }
+    )
 _cv = config["num_folds"]
 
 pipeline = Pipeline(
@@ -61,46 +76,60 @@ pipeline = Pipeline(
 # ------------------------------------------------------------------------------
 #  Inference Function
 # ------------------------------------------------------------------------------
-def infer(PKL_MODL, words: List[str]) -> List[Tuple[str, float]]:
+def infer(
+    PKL_MODL, words: List[str], max_workers: int = 8
+) -> List[Tuple[str, float]]:
     """
     Return a sorted list of (word, score) tuples, from most assumed good (score high)
     to most assumed bad (score low).
+
+    Embedding requests for the chunks are independent, so up to max_workers of
+    them are in flight at once; the vectors are then scored in a single
+    decision_function call.
     """
+    if not words:
+        return []
+
     chunk_size = 1500
-    words_considered = [add_prefix(w, get_clues_for_word(w)) for w in words]
-    word_scores = []
+    clues = get_clues_for_words(words)
+    words_considered = [add_prefix(w, clues[w.upper()]) for w in words]
     with open(PKL_MODL, "rb") as file:
         clf = pickle.load(file)
 
-    for i in tqdm.tqdm(range(0, len(words_considered), chunk_size)):
-        batch_words = words_considered[i : i + chunk_size]
-        response = client.embeddings.create(input=batch_words, model=EMB_MODL).data
-        batch_out = [item.embedding for item in response]
+    chunks = [
+        words_considered[i : i + chunk_size]
+        for i in range(0, len(words_considered), chunk_size)
+    ]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # map() keeps the chunks in order, so rows line up with words
+        batches = list(tqdm.tqdm(executor.map(_embed_batch, chunks), total=len(chunks)))
 
-        batch_scores = clf.decision_function(batch_out)
+    scores = clf.decision_function(np.vstack(batches))
 
-        # Note: 'j - i' aligns with batch indexing vs. global indexing
-        word_scores += [
-            (words[j], float(batch_scores[j - i]))
-            for j in range(i, min(i + chunk_size, len(words)))
-        ]
+    # Sort high-to-low by decision_function score (stable, like sorted())
+    order = np.argsort(-scores, kind="stable")
+    return [(words[k], float(scores[k])) for k in order]
 
-        time.sleep(0.1)  # Pause to avoid overloading
 
-    # Sort high-to-low by decision_function score
-    word_scores_sorted = sorted(word_scores, key=lambda x: x[1], reverse=True)
-    return word_scores_sorted
+def _embed_batch(batch: List[str]) -> np.ndarray:
+    """Embeds one batch of prompts, returning a (len(batch), D) float32 array."""
+    response = client.embeddings.create(input=batch, model=EMB_MODL).data
+    return np.asarray([item.embedding for item in response], dtype=np.float32)
+
+
+_PROMPT_TMPL = (
+    "I am making a wordlist for crossword puzzle constructors. "
+    "Do you think you would be able to guess this word '{word}' if it was used in a puzzle? "
+    "Respond NO if you think '{word}' is too obscure and YES if you think '{word}' is common."
+).format
+_CLUES_HEADER = "\n\nHere are some possible clues: \n"
 
 
 def add_prefix(word: str, clues: list[str] = []) -> str:
-    prompt = (
-        "I am making a wordlist for crossword puzzle constructors. "
-        + f"Do you think you would be able to guess this word '{word}' if it was used in a puzzle? "
-        + f"Respond NO if you think '{word}' is too obscure and YES if you think '{word}' is common."
-    )
+    # The text must stay byte-for-byte the same: saved models were trained on it
+    prompt = _PROMPT_TMPL(word=word)
     if clues:
-        clues_out = "\n".join(["- " + c for c in clues])
-        prompt = prompt + "\n\n" + "Here are some possible clues: " + "\n" + clues_out
+        prompt += _CLUES_HEADER + "\n".join(["- " + c for c in clues])
     return prompt
 
 
@@ -150,18 +179,22 @@ def make_train_test_split(
 # ------------------------------------------------------------------------------
 def embed_in_chunks(
     words_clues_dict: dict[str, str], chunk_size: int = 1500
-) -> List[List[float]]:
+) -> np.ndarray:
     """
     Embed a list of words in manageable chunks (to avoid rate limits).
     Uses the 'get_embeddings' helper under the hood.
+    Returns a (len(words), D) float32 array, filled in place batch by batch.
     """
     words = list(words_clues_dict.keys())
-    vectors = []
+    vectors = np.empty((len(words), 0), dtype=np.float32)
     for i in tqdm.tqdm(range(0, len(words), chunk_size)):
         batch = words[i : i + chunk_size]
         batch_dict = {word: words_clues_dict[word] for word in batch}
         batch_vectors = get_embeddings(batch_dict)
-        vectors.extend(batch_vectors)
+        if i == 0:
+            # The embedding width is only known once the first batch is back
+            vectors = np.empty((len(words), len(batch_vectors[0])), dtype=np.float32)
+        vectors[i : i + len(batch)] = batch_vectors
         time.sleep(0.5)  # small pause to avoid rate-limit issues
     return vectors
 
@@ -170,10 +203,12 @@ def embed_in_chunks(
 #  3) Train Model (GridSearch)
 # ------------------------------------------------------------------------------
 def train_model(
-    X_train_vectors: List[List[float]], y_train: List[int]
+    X_train_vectors: np.ndarray, y_train: List[int], n_jobs: int = -1
 ) -> Tuple[SVC, dict]:
     """
     Given training vectors and labels, perform a GridSearchCV to find best SVM hyperparams.
+    Fits for each (parameter set, fold) pair run in parallel over n_jobs workers
+    (-1 uses every core).
     Returns the best estimator.
     """
     print("\nStarting SVM Grid Search (this may take a while)...")
@@ -186,7 +221,7 @@ def train_model(
         cv=_cv,
         scoring="accuracy",
         verbose=4,
-        n_jobs=1,
+        n_jobs=n_jobs,
     )
 
     grid_search.fit(X_train_vectors, y_train)
@@ -202,8 +237,13 @@ def train_model(
 
     best_clf = grid_search.best_estimator_
 
+    # A LinearSVC winner has the estimator itself under "svm"; log it by name
+    best_params = {
+        key: type(value).__name__ if key == "svm" else value
+        for key, value in grid_search.best_params_.items()
+    }
     log_output = {
-        "best_parameters": grid_search.best_params_,
+        "best_parameters": best_params,
         "search_time_seconds": int(elapsed_time),
     }
     return best_clf, log_output
@@ -212,9 +252,7 @@ def train_model(
 # ------------------------------------------------------------------------------
 #  4) Evaluate Model
 # ------------------------------------------------------------------------------
-def evaluate_model(
-    model: SVC, X_test_vectors: List[List[float]], y_test: List[int]
-) -> float:
+def evaluate_model(model: SVC, X_test_vectors: np.ndarray, y_test: List[int]) -> float:
     """
     Predict on test vectors, print and return the accuracy.
     """
@@ -228,7 +266,9 @@ def evaluate_model(
 #  5) Master Train Function
 # ------------------------------------------------------------------------------
 def train_svm(
-    set_1_words_clues: dict[str, list[str]], set_2_words_clues: dict[str, list[str]]
+    set_1_words_clues: dict[str, list[str]],
+    set_2_words_clues: dict[str, list[str]],
+    n_jobs: int = -1,
 ) -> tuple[SVC, dict]:
     """
     Master function that:
@@ -241,43 +281,30 @@ def train_svm(
 
     _train_limit = 10000000
 
-    set_1_words: list[str] = list(set_1_words_clues.keys())
-    set_2_words: list[str] = list(set_2_words_clues.keys())
-    set_1_words = set_1_words[
-        : min(_train_limit, len(set_1_words_clues), len(set_2_words_clues))
-    ]
-    set_2_words = set_2_words[
-        : min(_train_limit, len(set_1_words_clues), len(set_2_words_clues))
-    ]
+    limit = min(_train_limit, len(set_1_words_clues), len(set_2_words_clues))
+    set_1_words: list[str] = list(itertools.islice(set_1_words_clues, limit))
+    set_2_words: list[str] = list(itertools.islice(set_2_words_clues, limit))
 
     # -- 1) Split
     X_train_words, X_test_words, y_train, y_test = make_train_test_split(
         set_1_words, set_2_words, test_size=tt_split
     )
 
-    train_dict = {}
-    for word in X_train_words:
-        if word in set_1_words_clues:
-            train_dict[word] = set_1_words_clues[word]
-        else:
-            train_dict[word] = set_2_words_clues[word]
+    # set_1 wins for a word in both sets, as before
+    combined = {**set_2_words_clues, **set_1_words_clues}
+    train_dict = {word: combined[word] for word in X_train_words}
 
     # -- 2) Embed training and test sets
     print("Embedding train set...")
     X_train_vectors = embed_in_chunks(train_dict)
 
-    test_dict = {}
-    for word in X_test_words:
-        if word in set_1_words_clues:
-            test_dict[word] = set_1_words_clues[word]
-        else:
-            test_dict[word] = set_2_words_clues[word]
+    test_dict = {word: combined[word] for word in X_test_words}
 
     # -- 3) Train (grid search)
     tqdm.tqdm.write(c_blue + "Search Config:" + c_end)
     tqdm.tqdm.write(json.dumps(config, indent=2))
 
-    best_clf, log_output = train_model(X_train_vectors, y_train)
+    best_clf, log_output = train_model(X_train_vectors, y_train, n_jobs=n_jobs)
 
     print("Embedding test set...")
     X_test_vectors = embed_in_chunks(test_dict)
@@ -0,0 +1,53 @@
+"""Environment and config loading shared by the library and the scripts"""
+
+import copy
+import functools
+import importlib.util
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DATABASE_FILE = os.getenv("SQLITE_DB_FILE", "wordlist.db")
+EMB_MODL = os.getenv("EMB_MODL")
+CLUES_SOURCE = os.getenv("CLUES_SOURCE", "wordlist/lib/clues.template.py")
+SEARCH_CONFIG_FILE = "search_config.yml"
+
+
+def load_yaml(path: str) -> dict:
+    """
+    Parses a YAML file. The parse is cached, so the file is read once per process
+    (yaml is only imported the first time); each caller gets its own deep copy,
+    free to modify without affecting later calls.
+    """
+    return copy.deepcopy(_parse_yaml(path))
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_yaml(path: str) -> dict:
+    import yaml
+
+    with open(path, "r") as f:
+        return yaml.safe_load(f)
+
+
+def load_search_config() -> dict:
+    """Returns the parsed search_config.yml used for SVM training."""
+    return load_yaml(SEARCH_CONFIG_FILE)
+
+
+@functools.lru_cache(maxsize=None)
+def load_fetch_clues(clues_source: str = CLUES_SOURCE):
+    """
+    Loads the user defined `fetch_clues` function from the file at clues_source.
+    See wordlist/lib/clues.template.py for the expected signature.
+
+    The module is executed once per process; later calls return the same function.
+    (The source loader already reuses the compiled bytecode in __pycache__.)
+    """
+    module_name = os.path.splitext(os.path.basename(clues_source))[0]
+    spec = importlib.util.spec_from_file_location(module_name, clues_source)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.fetch_clues
@@ -1,48 +1,136 @@
 import json
 import fcntl
+import os
+import stat
+import tempfile
+
+from contextlib import contextmanager
+
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib json module is used without it
+    orjson = None
+
+
+def _dumps(data) -> bytes:
+    """Compact UTF-8 serialization, used on the read-modify-write paths."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@contextmanager
+def _write_lock(json_name):
+    """
+    Serializes writers of json_name on a sidecar "<json_name>.lock" file. The data
+    file itself is swapped out by os.replace(), so a lock on it would not carry over.
+
+    The lock file is left in place on purpose: deleting it while another writer is
+    waiting on it would let a third writer lock a fresh file and run concurrently.
+    It is empty and ignored by git (*.json.lock).
+    """
+    with open(json_name + ".lock", "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _file_mode(path) -> int:
+    """Permission bits of path, or those a plain open() would give a new file."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _replace_json(json_name, data, indent=False):
+    """
+    Writes data to a temporary file next to json_name and renames it over
+    json_name, so readers only ever see the old or the new file, never half of one.
+
+    :param indent: pretty-print with indent=4 (for files meant to be read by people)
+    """
+    if indent:
+        buf = json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+    else:
+        buf = _dumps(data)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(json_name)), suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(buf)
+        # mkstemp creates the file 0600; keep the mode json_name already had
+        os.chmod(tmp_name, _file_mode(json_name))
+        os.replace(tmp_name, json_name)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
 
 
 def load_json(json_name):
-    with open(json_name, "r+") as f:
-        fcntl.flock(f, fcntl.LOCK_EX)
+    with open(json_name, "rb") as f:
+        fcntl.flock(f, fcntl.LOCK_SH)
         try:
-            out = json.load(f)
+            out = _loads(f.read())
         finally:
             fcntl.flock(f, fcntl.LOCK_UN)
     return out
 
 
 def append_json(json_name, grid):
-    with open(json_name, "r+") as f:
-        fcntl.flock(f, fcntl.LOCK_EX)
-        try:
-            data = json.load(f)
-            data.append(grid)
-            f.seek(0)
-            json.dump(data, f, indent=4, ensure_ascii=False)
-            f.truncate()
-        finally:
-            fcntl.flock(f, fcntl.LOCK_UN)
+    with _write_lock(json_name):
+        data = load_json(json_name)
+        data.append(grid)
+        _replace_json(json_name, data)
 
 
 def remove_from_json(json_file: str, entry):
-    with open(json_file, "r+") as f:
+    with _write_lock(json_file):
+        data = load_json(json_file)
+        if entry in data:
+            data.remove(entry)
+            _replace_json(json_file, data)
+            return True
+        return False
+
+
+def write_json(json_name, data):
+    with _write_lock(json_name):
+        _replace_json(json_name, data, indent=True)
+
+
+def append_jsonl(path, entry):
+    """
+    Appends entry as one line of a JSON Lines file. Unlike append_json this does not
+    rewrite the file, so each append costs one record of IO however large it grows.
+    """
+    line = _dumps(entry) + b"\n"
+    with open(path, "ab") as f:
         fcntl.flock(f, fcntl.LOCK_EX)
         try:
-            data = json.load(f)
-            if entry in data:
-                data.remove(entry)
-                f.seek(0)
-                json.dump(data, f, indent=4, ensure_ascii=False)
-                f.truncate()
-                return True
-            return False
+            f.write(line)
         finally:
             fcntl.flock(f, fcntl.LOCK_UN)
 
 
-def write_json(json_name, data):
-    with open(json_name, "w") as f:
-        fcntl.flock(f, fcntl.LOCK_EX)
-        json.dump(data, f, indent=4, ensure_ascii=False)
-        fcntl.flock(f, fcntl.LOCK_UN)
+def load_jsonl(path):
+    """Yields the records of a JSON Lines file written by append_jsonl, in order."""
+    with open(path, "rb") as f:
+        fcntl.flock(f, fcntl.LOCK_SH)
+        try:
+            for line in f:
+                if line.strip():
+                    yield _loads(line)
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
@@ -1,4 +1,7 @@
-import re
+# Every ASCII byte that is not a letter, for bytes.translate() to delete
+_NON_LETTER_BYTES = bytes(
+    c for c in range(128) if not (65 <= c <= 90 or 97 <= c <= 122)  # A-Z, a-z
+)
 
 
 def load_cc_txt_as_dict(file_path):
@@ -26,9 +29,16 @@ def load_cc_txt_as_dict(file_path):
             # Split once on the semicolon
             text_part, int_part = line.split(";", 1)
 
-            # Convert text to uppercase and remove spaces & punctuation
-            # This regex keeps only letters
-            cleaned_key = re.sub(r"[^A-Za-z]", "", text_part.upper())
+            # Convert text to uppercase and remove spaces & punctuation.
+            # Most entries are already plain letters; otherwise drop non-ASCII
+            # characters and delete the non-letter bytes in C, keeping only A-Z.
+            cleaned_key = text_part.upper()
+            if not (cleaned_key.isascii() and cleaned_key.isalpha()):
+                cleaned_key = (
+                    cleaned_key.encode("ascii", "ignore")
+                    .translate(None, _NON_LETTER_BYTES)
+                    .decode("ascii")
+                )
 
             if len(cleaned_key) < 3 or len(cleaned_key) > 39:  # dont consider these
                 continue